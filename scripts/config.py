@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
 
+# Marks a missing key in get_config_value()
+_MISSING = object()
 
 # Default configuration values
 DEFAULT_CONFIG = {
@@ -177,9 +179,11 @@ def get_config_value(config: Dict, *keys: str, default: Any = None) -> Any:
     current = config
 
     for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+        if not isinstance(current, dict):
+            return default
+        # Single lookup; the sentinel keeps explicit None values distinct from missing keys
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return default
 
     return current
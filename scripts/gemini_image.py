@@ -15,7 +15,7 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union, TYPE_CHECKING
 
 from .config import get_config, get_config_value
 
@@ -34,6 +34,13 @@ DEFAULT_TIMEOUT = 60
 DEFAULT_RETRY_COUNT = 3
 RATE_LIMIT_DELAY = 6.0  # 안전 간격: 60초/10요청 = 6초
 
+# Fallback trigger conditions (lowercased; matched against the lowercased error)
+FALLBACK_TRIGGERS = tuple(trigger.lower() for trigger in (
+    "429", "QUOTA_EXCEEDED", "RATE_LIMIT", "ResourceExhausted",
+    "SAFETY", "blocked", "filtered", "RECITATION",
+    "INVALID_ARGUMENT", "does not support", "not support",
+))
+
 
 @dataclass
 class ImageResult:
@@ -75,6 +82,15 @@ class BatchResult:
         )
 
 
+class BatchItem(NamedTuple):
+    """Single generation config for generate_batch_with_text_overlay"""
+
+    prompt: str
+    filename: str
+    text_config: Optional["PromptTextOverlayConfig"] = None
+    watermark_config: Optional["WatermarkConfig"] = None
+
+
 class GeminiImageGenerator:
     """
     Image generator using Gemini API (new google-genai SDK)
@@ -222,13 +238,8 @@ class GeminiImageGenerator:
         if not error_message:
             return True
 
-        # Fallback trigger conditions
-        fallback_triggers = [
-            "429", "QUOTA_EXCEEDED", "RATE_LIMIT", "ResourceExhausted",
-            "SAFETY", "blocked", "filtered", "RECITATION",
-            "INVALID_ARGUMENT", "does not support", "not support"
-        ]
-        return any(trigger.lower() in error_message.lower() for trigger in fallback_triggers)
+        error_lower = error_message.lower()
+        return any(trigger in error_lower for trigger in FALLBACK_TRIGGERS)
 
     async def _generate_with_model(
         self,
@@ -677,7 +688,9 @@ class GeminiImageGenerator:
         try:
             from .text_overlay import add_text_to_existing_image
 
-            overlay_result = add_text_to_existing_image(
+            # Off the event loop so concurrent batch items overlay in parallel
+            overlay_result = await asyncio.to_thread(
+                add_text_to_existing_image,
                 image_path=str(temp_bg_path),
                 text_config=text_config,
                 output_path=output_path,
@@ -803,8 +816,9 @@ class GeminiImageGenerator:
                     generation_time=(datetime.now() - start_time).total_seconds(),
                 )
 
-            # Add watermark
-            overlay_result = add_watermark_to_image(
+            # Add watermark (off the event loop so batch items run in parallel)
+            overlay_result = await asyncio.to_thread(
+                add_watermark_to_image,
                 image_path=str(temp_img_path),
                 watermark_config=watermark_config,
                 output_path=output_path,
@@ -846,7 +860,7 @@ class GeminiImageGenerator:
 
     async def generate_batch_with_text_overlay(
         self,
-        items: List[Dict[str, Any]],
+        items: List[Union[BatchItem, Dict[str, Any]]],
         output_dir: str,
         concurrent_limit: int = 2,
     ) -> BatchResult:
@@ -854,10 +868,11 @@ class GeminiImageGenerator:
         Generate multiple images with text overlay in batch.
 
         Args:
-            items: List of generation configs, each containing:
+            items: List of generation configs (BatchItem or dict), each containing:
                 - prompt: Image generation prompt
                 - filename: Output filename
                 - text_config: TextOverlayConfig (optional, if None uses regular generation)
+                - watermark_config: WatermarkConfig (optional, takes precedence over text_config)
             output_dir: Output directory
             concurrent_limit: Concurrent execution limit
 
@@ -895,12 +910,15 @@ class GeminiImageGenerator:
         results: List[ImageResult] = []
         semaphore = asyncio.Semaphore(concurrent_limit)
 
-        async def generate_with_limit(item: Dict[str, Any]) -> ImageResult:
+        async def generate_with_limit(item: Union[BatchItem, Dict[str, Any]]) -> ImageResult:
             async with semaphore:
-                prompt = item.get("prompt", "")
-                filename = item.get("filename", f"image_{len(results):02d}.png")
-                text_config = item.get("text_config")
-                watermark_config = item.get("watermark_config")
+                if isinstance(item, BatchItem):
+                    prompt, filename, text_config, watermark_config = item
+                else:
+                    prompt = item.get("prompt", "")
+                    filename = item.get("filename", f"image_{len(results):02d}.png")
+                    text_config = item.get("text_config")
+                    watermark_config = item.get("watermark_config")
                 save_path = str(output_path / filename)
 
                 if watermark_config:
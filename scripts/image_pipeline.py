@@ -13,19 +13,44 @@ Workflow:
 """
 
 import asyncio
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from .gemini_image import GeminiImageGenerator, ImageResult, BatchResult
+from .config import get_config
+from .gemini_image import BatchItem, GeminiImageGenerator, ImageResult, BatchResult
 from .prompt_converter import (
     TextOverlayConfig,
     WatermarkConfig,
     extract_watermark_config,
 )
-from .text_overlay import TextOverlayProcessor, add_watermark_to_image
+
+
+# "## [Image N] role" sections, each running up to the next section header
+_IMAGE_SECTION_RE = re.compile(
+    r"##\s*\[Image\s*(\d+)\]\s*(.+?)(?=##\s*\[Image|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Fenced prompt block after an "AI Generation Prompt" label (Mode B / B-3),
+# in either plain ("Label:") or bold ("**Label:**") markdown form
+_PROMPT_BLOCK_RE = re.compile(
+    r"AI Generation Prompt[:\s]*(?:\*\*\s*)?\n```\n?(.*?)\n?```",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Legacy Mode B-2 also accepts a "Background Only" label
+_BACKGROUND_PROMPT_BLOCK_RE = re.compile(
+    r"(?:AI Generation Prompt|Background Only)[:\s]*(?:\*\*\s*)?\n```\n?(.*?)\n?```",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Characters dropped from a role before it becomes part of a filename
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w가-힣\s]")
 
 
 @dataclass
@@ -113,6 +138,9 @@ class ImagePipeline:
         Args:
             api_key: Google API key (optional, loads from env if not provided)
         """
+        # Deferred: text_overlay pulls in Pillow, which parse-only callers never need
+        from .text_overlay import TextOverlayProcessor
+
         self.generator = GeminiImageGenerator(api_key=api_key)
         self.overlay_processor = TextOverlayProcessor()
 
@@ -218,22 +246,22 @@ class ImagePipeline:
                 total_time=0.0,
             )
 
-        # Prepare output directory
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Output directory is created by generate_batch_with_text_overlay()
 
-        # Build batch items
+        # Build batch items and count text overlay items in a single pass
         batch_items = []
+        text_overlay_count = 0
         for item in items:
-            batch_item = {
-                "prompt": item.prompt,
-                "filename": item.filename,
-                # New workflow: use watermark_config for Mode B-3
-                "watermark_config": item.watermark_config if item.mode == "B-3" else None,
+            if item.text_config is not None:
+                text_overlay_count += 1
+            batch_items.append(BatchItem(
+                prompt=item.prompt,
+                filename=item.filename,
                 # Legacy support: use text_config for Mode B-2
-                "text_config": item.text_config if (use_text_overlay and item.mode == "B-2") else None,
-            }
-            batch_items.append(batch_item)
+                text_config=item.text_config if (use_text_overlay and item.mode == "B-2") else None,
+                # New workflow: use watermark_config for Mode B-3
+                watermark_config=item.watermark_config if item.mode == "B-3" else None,
+            ))
 
         # Execute batch generation
         batch_result = await self.generator.generate_batch_with_text_overlay(
@@ -242,9 +270,6 @@ class ImagePipeline:
             concurrent_limit=concurrent_limit,
         )
 
-        # Count text overlay items
-        text_overlay_count = sum(1 for item in items if item.text_config is not None)
-
         total_time = (datetime.now() - start_time).total_seconds()
 
         return PipelineResult(
@@ -261,10 +286,12 @@ class ImagePipeline:
         Parse image guide markdown to extract pipeline items.
 
         Supports formats:
-        - Mode A: 📷 Reference Image
         - Mode B: 🎨 AI Generation
         - Mode B-2: 🎨 AI Generation (Background Only) + Text Overlay
-        - Mode C: 🔷 SVG Generation
+        - Mode B-3: 🎨 AI Generation + Watermark Config
+
+        Mode A (📷 Reference Image) and Mode C (🔷 SVG Generation) sections
+        are skipped since they are not generated via Gemini API.
 
         Args:
             content: Image guide markdown content
@@ -275,16 +302,12 @@ class ImagePipeline:
         items = []
 
         # Split by image sections
-        image_pattern = r"##\s*\[Image\s*(\d+)\]\s*(.+?)(?=##\s*\[Image|\Z)"
-        matches = re.findall(image_pattern, content, re.DOTALL | re.IGNORECASE)
-
-        for match in matches:
-            index = int(match[0])
-            section_content = match[1]
+        for match in _IMAGE_SECTION_RE.finditer(content):
+            index = int(match.group(1))
+            section_content = match.group(2)
 
             # Extract role (first line after the header)
-            role_match = re.search(r"^\s*(.+?)\s*$", section_content.split("\n")[0])
-            role = role_match.group(1) if role_match else f"Image {index}"
+            role = section_content.partition("\n")[0].strip() or f"Image {index}"
 
             # Determine mode and extract relevant data
             item = self._parse_image_section(index, role, section_content)
@@ -308,34 +331,20 @@ class ImagePipeline:
             PipelineItem or None if parsing fails
         """
         # Check for Mode B-3 (AI renders text + Watermark Only) - NEW FORMAT
-        if "[Watermark Config]" in content or "Watermark Config" in content.lower():
+        if "[Watermark Config]" in content or "watermark config" in content.lower():
             return self._parse_mode_b3(index, role, content)
 
         # Check for Mode B-2 (DEPRECATED: Background Only + Text Overlay)
         # Keep for backward compatibility but treat as Mode B
-        if "AI Generation (Background Only)" in content or "Background Only" in content:
+        if "Background Only" in content:
             return self._parse_mode_b2_legacy(index, role, content)
 
         # Check for Mode B (Regular AI Generation with text in prompt)
         if "🎨 AI Generation" in content or "AI Generation Prompt" in content:
             return self._parse_mode_b(index, role, content)
 
-        # Check for Mode A (Reference Image)
-        if "📷" in content or "Reference Image" in content or "Downloaded image" in content:
-            return self._parse_mode_a(index, role, content)
-
-        # Check for Mode C (SVG Generation)
-        if "🔷" in content or "SVG Generation" in content:
-            return self._parse_mode_c(index, role, content)
-
-        return None
-
-    def _parse_mode_a(
-        self, index: int, role: str, content: str
-    ) -> Optional[PipelineItem]:
-        """Parse Mode A (Reference Image) section"""
-        # Mode A uses downloaded reference images, not generated
-        # Return None as we don't generate these
+        # Mode A (Reference Image) and Mode C (SVG Generation) are not
+        # generated via Gemini API, so anything else is skipped
         return None
 
     def _parse_mode_b(
@@ -343,19 +352,7 @@ class ImagePipeline:
     ) -> Optional[PipelineItem]:
         """Parse Mode B (AI Generation) section"""
         # Extract prompt from code block
-        prompt_match = re.search(
-            r"AI Generation Prompt[:\s]*\n```\n?(.*?)\n?```",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-        if not prompt_match:
-            # Try alternative format
-            prompt_match = re.search(
-                r"\*\*AI Generation Prompt[:\s]*\*\*\s*\n```\n?(.*?)\n?```",
-                content,
-                re.DOTALL | re.IGNORECASE
-            )
-
+        prompt_match = _PROMPT_BLOCK_RE.search(content)
         if not prompt_match:
             return None
 
@@ -384,11 +381,7 @@ class ImagePipeline:
         - PIL only adds watermark to the final image
         """
         # Extract prompt (includes text instructions for AI)
-        prompt_match = re.search(
-            r"(?:AI Generation Prompt)[:\s]*\n```\n?(.*?)\n?```",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        prompt_match = _PROMPT_BLOCK_RE.search(content)
         if not prompt_match:
             return None
 
@@ -419,11 +412,7 @@ class ImagePipeline:
         New code should use Mode B-3 (AI renders text + Watermark Only).
         """
         # Extract background-only prompt
-        prompt_match = re.search(
-            r"(?:AI Generation Prompt|Background Only)[:\s]*\n```\n?(.*?)\n?```",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        prompt_match = _BACKGROUND_PROMPT_BLOCK_RE.search(content)
         if not prompt_match:
             return None
 
@@ -444,14 +433,6 @@ class ImagePipeline:
             mode="B-2",
         )
 
-    def _parse_mode_c(
-        self, index: int, role: str, content: str
-    ) -> Optional[PipelineItem]:
-        """Parse Mode C (SVG Generation) section"""
-        # Mode C uses SVG generation, not Gemini API
-        # Return None as this requires different handling
-        return None
-
     def _extract_text_overlay_config(self, content: str) -> Optional[TextOverlayConfig]:
         """
         Extract TextOverlayConfig from section content.
@@ -546,15 +527,56 @@ class ImagePipeline:
             Filename string (e.g., "01_썸네일.png")
         """
         # Clean role for filename
-        clean_role = re.sub(r"[^\w가-힣\s]", "", role)
-        clean_role = clean_role.strip().replace(" ", "_")[:20]
-
-        if not clean_role:
-            clean_role = "image"
+        clean_role = _FILENAME_UNSAFE_RE.sub("", role).strip().replace(" ", "_")[:20] or "image"
 
         return f"{index:02d}_{clean_role}.png"
 
 
+# Shared pipelines per resolved API key, with the config instance each was built from
+_PIPELINES: Dict[Optional[str], Tuple[Dict[str, Any], ImagePipeline]] = {}
+
+
+def _get_pipeline(api_key: Optional[str] = None) -> ImagePipeline:
+    """
+    Return a shared ImagePipeline for the given API key.
+
+    The convenience functions below reuse one pipeline per key so repeated
+    calls in the same process skip generator/processor construction. The
+    environment key is looked up on every call and a pipeline is rebuilt
+    after reload_config(), so key and config.yaml changes still apply.
+    """
+    api_key = api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+    config = get_config()
+
+    cached = _PIPELINES.get(api_key)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    pipeline = ImagePipeline(api_key=api_key)
+    _PIPELINES[api_key] = (config, pipeline)
+    return pipeline
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion for the synchronous wrappers.
+
+    Uses uvloop (optional extra, not available on Windows) when installed,
+    otherwise the default asyncio event loop. uvloop.run() needs uvloop 0.18+;
+    older releases fall back to asyncio.run() as well.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            if hasattr(uvloop, "run"):
+                return uvloop.run(coro)
+
+    return asyncio.run(coro)
+
+
 # Convenience functions for direct usage
 
 async def generate_blog_image(
@@ -593,7 +615,7 @@ async def generate_blog_image(
             sub_text="연 5% 고금리 상품 총정리"
         )
     """
-    pipeline = ImagePipeline(api_key=api_key)
+    pipeline = _get_pipeline(api_key)
 
     text_config = TextOverlayConfig(
         main_text=main_text,
@@ -627,7 +649,7 @@ def generate_blog_image_sync(
 
     See generate_blog_image for arguments.
     """
-    return asyncio.run(
+    return _run_sync(
         generate_blog_image(
             prompt=prompt,
             output_path=output_path,
@@ -667,10 +689,10 @@ async def process_image_guide_file(
         )
         print(result.summary())
     """
-    with open(guide_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Read off the event loop so other pipelines sharing it keep running
+    content = await asyncio.to_thread(Path(guide_path).read_text, encoding="utf-8")
 
-    pipeline = ImagePipeline(api_key=api_key)
+    pipeline = _get_pipeline(api_key)
     return await pipeline.process_image_guide(
         image_guide_content=content,
         output_dir=output_dir,
@@ -689,7 +711,7 @@ def process_image_guide_file_sync(
 
     See process_image_guide_file for arguments.
     """
-    return asyncio.run(
+    return _run_sync(
         process_image_guide_file(
             guide_path=guide_path,
             output_dir=output_dir,
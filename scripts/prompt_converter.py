@@ -4,11 +4,112 @@ Prompt conversion module
 Converts image guide prompts to Gemini API optimized format.
 """
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from .config import get_config, get_config_value
+from .shared_types import DATACLASS_SLOTS
+
+
+# Text instruction patterns removed by strip_text_instructions(),
+# fused into one alternation so the prompt is scanned once.
+#
+# The leading run of separators is matched once, atomically, via the
+# (?=([,\s]*))\1 idiom (atomic groups need Python 3.11+), and optional
+# words carry their own trailing separators. Chaining several [,\s]*
+# around optional groups backtracked catastrophically on long runs of
+# spaces or commas (seconds for ~100 spaces).
+_TEXT_STRIP_RE = re.compile(
+    r'(?=([,\s]*))\1(?:'
+    + "|".join((
+        # Text overlay patterns
+        r'(?:(?:include|with|add)[,\s]*)?(?:(?:bold|large|big|small)[,\s]*)?(?:(?:Korean|English|Chinese)[,\s]*)?text\s*overlay[:\s]*["\'][^"\']*["\']',
+        r'(?:(?:bold|large|big)[,\s]*)?["\'][^"\']*["\'][,\s]*(?:(?:Korean|English)\s*)?text\s*overlay',
+        r'text\s*overlay[:\s]*["\'][^"\']*["\']',
+        r'["\'][^"\']*["\'][,\s]*text',
+        # Text-related keywords
+        r'include\s+(?:bold\s+)?(?:Korean\s+)?text[^,\.]*',
+        r'(?:bold|large)\s+(?:Korean\s+)?text[^,\.]*',
+        r'Korean\s+text[^,\.]*',
+        r'text\s+saying[^,\.]*',
+        r'with\s+text[^,\.]*',
+        r'text\s+reading[^,\.]*',
+        # Typography patterns
+        r'typography[^,\.]*',
+        r'lettering[^,\.]*',
+        r'title\s+text[^,\.]*',
+        r'headline[^,\.]*',
+    ))
+    + r')',
+    re.IGNORECASE,
+)
+_TEXT_STRIP_KEYWORDS = ("text", "typography", "lettering", "headline")
+
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_RATIO_RE = re.compile(r"\d+:\d+\s*ratio")
+
+# Legacy (━ separated) image guide format
+_BLOCK_SEPARATOR = "━" * 20
+_BLOCK_SEPARATOR_RE = re.compile(r"━{20,}")
+_BLOCK_HEADER_RE = re.compile(r"\[이미지\s*(\d+)\]\s*(.+)")
+_BLOCK_HEADER_ALT_RE = re.compile(r"\[(\w+)\]\s*(.+)")
+_BLOCK_DESC_RE = re.compile(r"\[한글 설명\]\s*\n(.+?)(?=\n\[|$)", re.DOTALL)
+_BLOCK_PROMPT_RE = re.compile(r"\[AI 생성 프롬프트\]\s*\n(.+?)(?=\n\[|$)", re.DOTALL)
+_BLOCK_STYLE_RE = re.compile(r"\[스타일 가이드\]\s*\n(.+?)(?=━|$)", re.DOTALL)
+
+_FILENAME_INVALID_RE = re.compile(r'[<>:"/\\|?*]')
+# Anything sanitize_filename() would rewrite (invalid characters or whitespace)
+_FILENAME_UNCLEAN_RE = re.compile(r'[<>:"/\\|?*\s]')
+
+# Position hints for extract_text_config(), in priority order
+_POSITION_HINTS = {
+    'center': ['center', '중앙', '가운데'],
+    'top': ['top', '상단', '위'],
+    'bottom': ['bottom', '하단', '아래'],
+    'top-left': ['top-left', '좌상단'],
+    'top-right': ['top-right', '우상단'],
+    'bottom-left': ['bottom-left', '좌하단'],
+    'bottom-right': ['bottom-right', '우하단'],
+}
+_POSITION_RANK = {position: rank for rank, position in enumerate(_POSITION_HINTS)}
+_POSITION_BY_HINT = {
+    hint: position
+    for position, keywords in _POSITION_HINTS.items()
+    for hint in keywords
+}
+
+
+def _position_hint_pattern(hint: str) -> str:
+    """Regex for one position hint that skips matches inside unrelated words"""
+    if hint.isascii():
+        # Whole words only: not "top" in "desktop"/"topic", "center" in "epicenter"
+        # ("centered" still counts)
+        return r"(?<![a-z])" + re.escape(hint) + r"(?:(?![a-z])|(?=ed(?![a-z])))"
+    if len(hint) == 1:
+        # "위" alone or with a particle, not inside 범위/순위/단위 or 위치/위해/위험
+        return r"(?<![가-힣])" + re.escape(hint) + r"(?:(?![가-힣])|(?=[에쪽로의]))"
+    return re.escape(hint)
+
+
+# Longest first, so "top-left"/"좌상단" are not read as "top"/"상단"
+_POSITION_HINT_RE = re.compile(
+    "|".join(
+        _position_hint_pattern(hint)
+        for hint in sorted(_POSITION_BY_HINT, key=len, reverse=True)
+    )
+)
+
+# All watermark_* fields in one pass; the group that matched names the field
+_WATERMARK_FIELD_RE = re.compile(
+    r"watermark_(?:"
+    r"(?P<str_key>text|position|font_color)[:\s]*[\"'](?P<str_value>.+?)[\"']"
+    r"|(?P<int_key>margin_bottom|font_size)[:\s]*(?P<int_value>\d+)"
+    r"|enabled[:\s]*(?P<enabled>true|false)"
+    r")",
+    re.IGNORECASE,
+)
 
 
 @dataclass
@@ -60,7 +161,7 @@ class TextOverlayConfig:
     watermark_enabled: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImageGuideItem:
     """Data class for image guide items"""
 
@@ -80,7 +181,7 @@ class ImageGuideItem:
             self.text_overlay = TextOverlayConfig()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GeminiPrompt:
     """Data class for Gemini prompts"""
 
@@ -104,39 +205,19 @@ def strip_text_instructions(prompt: str) -> str:
         >>> strip_text_instructions('Blog thumbnail with "Hello World" text overlay')
         'Blog thumbnail'
     """
-    # Patterns to remove
-    text_patterns = [
-        # Text overlay patterns
-        r'[,\s]*(?:include|with|add)?[,\s]*(?:bold|large|big|small)?[,\s]*(?:Korean|English|Chinese)?[,\s]*text\s*overlay[:\s]*["\'][^"\']*["\']',
-        r'[,\s]*(?:bold|large|big)?[,\s]*["\'][^"\']*["\'][,\s]*(?:Korean|English)?\s*text\s*overlay',
-        r'[,\s]*text\s*overlay[:\s]*["\'][^"\']*["\']',
-        r'[,\s]*["\'][^"\']*["\'][,\s]*text',
-        # Text-related keywords
-        r'[,\s]*include\s+(?:bold\s+)?(?:Korean\s+)?text[^,\.]*',
-        r'[,\s]*(?:bold|large)\s+(?:Korean\s+)?text[^,\.]*',
-        r'[,\s]*Korean\s+text[^,\.]*',
-        r'[,\s]*text\s+saying[^,\.]*',
-        r'[,\s]*with\s+text[^,\.]*',
-        r'[,\s]*text\s+reading[^,\.]*',
-        # Typography patterns
-        r'[,\s]*typography[^,\.]*',
-        r'[,\s]*lettering[^,\.]*',
-        r'[,\s]*title\s+text[^,\.]*',
-        r'[,\s]*headline[^,\.]*',
-    ]
-
-    result = prompt
-    for pattern in text_patterns:
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+    # Every strip pattern needs one of these keywords; skip the scan without them
+    lowered = prompt.lower()
+    if any(keyword in lowered for keyword in _TEXT_STRIP_KEYWORDS):
+        result = _TEXT_STRIP_RE.sub('', prompt)
+    else:
+        result = prompt
 
     # Clean up multiple commas and spaces
-    result = re.sub(r',\s*,', ',', result)
-    result = re.sub(r'\s+', ' ', result)
-    result = re.sub(r',\s*$', '', result)
-    result = re.sub(r'^\s*,', '', result)
-    result = result.strip()
+    result = " ".join(result.split())
+    while ",," in result or ", ," in result:
+        result = result.replace(", ,", ",").replace(",,", ",")
 
-    return result
+    return result.strip(" ,")
 
 
 def extract_text_config(prompt: str, korean_desc: str = "") -> TextOverlayConfig:
@@ -149,42 +230,46 @@ def extract_text_config(prompt: str, korean_desc: str = "") -> TextOverlayConfig
 
     Returns:
         TextOverlayConfig with extracted text information
+
+    Example:
+        >>> extract_text_config("Topic: 금리 인상, clean design").position
+        'center'
+        >>> extract_text_config("text at bottom, topics list").position
+        'bottom'
+        >>> extract_text_config("desktop wallpaper", "범위 설명, 위치 안내").position
+        'center'
+        >>> extract_text_config("", "제목은 이미지 위에 배치").position
+        'top'
     """
     config = TextOverlayConfig()
 
-    # Extract quoted text from prompt
-    quoted_texts = re.findall(r'["\']([^"\']+)["\']', prompt)
-
     # Extract Korean text from Korean description
-    korean_quoted = re.findall(r'["\']([^"\']+)["\']', korean_desc)
+    korean_quoted = _QUOTED_RE.findall(korean_desc)
 
     # Prioritize Korean quoted text for main_text
     if korean_quoted:
         config.main_text = korean_quoted[0]
         if len(korean_quoted) > 1:
             config.sub_text = korean_quoted[1]
-    elif quoted_texts:
-        # Use English quoted text as fallback
-        config.main_text = quoted_texts[0]
-        if len(quoted_texts) > 1:
-            config.sub_text = quoted_texts[1]
-
-    # Detect position hints
-    position_hints = {
-        'center': ['center', '중앙', '가운데'],
-        'top': ['top', '상단', '위'],
-        'bottom': ['bottom', '하단', '아래'],
-        'top-left': ['top-left', '좌상단'],
-        'top-right': ['top-right', '우상단'],
-        'bottom-left': ['bottom-left', '좌하단'],
-        'bottom-right': ['bottom-right', '우하단'],
-    }
-
+    else:
+        # Use English quoted text as fallback (only scanned when needed)
+        quoted_texts = _QUOTED_RE.findall(prompt)
+        if quoted_texts:
+            config.main_text = quoted_texts[0]
+            if len(quoted_texts) > 1:
+                config.sub_text = quoted_texts[1]
+
+    # Detect position hints: the highest-priority position mentioned anywhere
     combined_text = f"{prompt} {korean_desc}".lower()
-    for position, keywords in position_hints.items():
-        if any(kw in combined_text for kw in keywords):
+    best_rank = None
+    for match in _POSITION_HINT_RE.finditer(combined_text):
+        position = _POSITION_BY_HINT[match.group()]
+        rank = _POSITION_RANK[position]
+        if best_rank is None or rank < best_rank:
             config.position = position
-            break
+            best_rank = rank
+            if rank == 0:
+                break
 
     # Detect font size hints
     if 'bold' in combined_text or '굵은' in korean_desc:
@@ -202,7 +287,7 @@ def extract_text_config(prompt: str, korean_desc: str = "") -> TextOverlayConfig
 
 
 def convert_to_gemini_prompt(
-    image_guide: Dict[str, Any],
+    image_guide: Union[ImageGuideItem, Dict[str, Any]],
     background_only: bool = False,
 ) -> str:
     """
@@ -213,7 +298,7 @@ def convert_to_gemini_prompt(
     Text is no longer stripped from prompts.
 
     Args:
-        image_guide: Image guide dictionary
+        image_guide: ImageGuideItem, or image guide dictionary with
             - korean_description: Korean description
             - prompt: English prompt
             - style_guide: Style guide (colors, mood, format, ratio)
@@ -231,9 +316,12 @@ def convert_to_gemini_prompt(
         >>> convert_to_gemini_prompt(guide)
         "Create a high-quality blog image. Blog thumbnail, baby savings concept..."
     """
-    korean_desc = image_guide.get("korean_description", "")
-    original_prompt = image_guide.get("prompt", "")
-    style_guide = image_guide.get("style_guide", {})
+    if isinstance(image_guide, ImageGuideItem):
+        original_prompt = image_guide.prompt
+        style_guide = image_guide.style_guide
+    else:
+        original_prompt = image_guide.get("prompt", "")
+        style_guide = image_guide.get("style_guide", {})
 
     # Prompt components
     parts = []
@@ -244,30 +332,15 @@ def convert_to_gemini_prompt(
     # 2. English prompt (use existing prompt as-is, including text instructions)
     if original_prompt:
         # Remove ratio information (handled separately)
-        cleaned_prompt = re.sub(r"\d+:\d+\s*ratio", "", original_prompt)
+        if "ratio" in original_prompt and ":" in original_prompt:
+            cleaned_prompt = _RATIO_RE.sub("", original_prompt)
+        else:
+            cleaned_prompt = original_prompt
         # NOTE: No longer strip text instructions - AI renders text directly
         parts.append(cleaned_prompt.strip())
 
     # 3. Convert style guide
-    style_parts = []
-
-    if "색상" in style_guide:
-        color = style_guide["색상"]
-        color_en = translate_color(color)
-        style_parts.append(f"Color scheme: {color_en}")
-
-    if "분위기" in style_guide:
-        mood = style_guide["분위기"]
-        mood_en = translate_mood(mood)
-        style_parts.append(f"Mood: {mood_en}")
-
-    if "형식" in style_guide:
-        format_type = style_guide["형식"]
-        format_en = translate_format(format_type)
-        style_parts.append(f"Style: {format_en}")
-
-    if style_parts:
-        parts.append(" ".join(style_parts))
+    parts.extend(_build_style_parts(style_guide))
 
     # 4. Quality assurance phrase
     parts.append("High resolution, professional quality, suitable for blog use.")
@@ -275,86 +348,124 @@ def convert_to_gemini_prompt(
     return " ".join(parts)
 
 
+# Korean -> English style guide vocabulary used by translate_*()
+_COLOR_MAP = {
+    "파스텔 블루": "soft pastel blue",
+    "파스텔 핑크": "soft pastel pink",
+    "민트 그린": "mint green, seafoam",
+    "따뜻한 노랑": "warm yellow, golden yellow",
+    "네이비": "navy blue, deep blue",
+    "골드": "gold, champagne gold",
+    "코랄 핑크": "coral pink, soft coral",
+    "그레이": "gray, neutral gray",
+    "화이트": "white, clean white",
+    "블랙": "black, elegant black",
+    "베이지": "beige, warm beige",
+    "그린": "green, fresh green",
+    "오렌지": "orange, warm orange",
+    "레드": "red, vibrant red",
+    "퍼플": "purple, elegant purple",
+    "그라데이션": "gradient",
+}
+
+_MOOD_MAP = {
+    "따뜻한": "warm, cozy",
+    "친근한": "friendly, approachable",
+    "전문적": "professional, expert",
+    "신뢰감": "trustworthy, reliable",
+    "깔끔한": "clean, neat",
+    "모던한": "modern, contemporary",
+    "세련된": "sophisticated, elegant",
+    "밝은": "bright, cheerful",
+    "차분한": "calm, serene",
+    "활기찬": "energetic, lively",
+    "감성적": "emotional, sentimental",
+    "정보성": "informative, educational",
+    "눈에 띄는": "eye-catching, attention-grabbing",
+    "클릭 유도": "click-worthy, engaging",
+    "희망적": "hopeful, optimistic",
+    "사랑스러운": "lovely, adorable",
+}
+
+_FORMAT_MAP = {
+    "인포그래픽": "infographic, data visualization",
+    "일러스트": "illustration, illustrated",
+    "사진풍": "photographic, photo-realistic",
+    "플랫디자인": "flat design, minimalist",
+    "모던 썸네일": "modern thumbnail design",
+    "차트": "chart, graph",
+    "다이어그램": "diagram, flowchart",
+    "체크리스트": "checklist, list design",
+    "비교표": "comparison table, comparison chart",
+    "프로세스": "process diagram, step-by-step",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def translate_color(korean_color: str) -> str:
     """Convert Korean color description to English"""
-    color_map = {
-        "파스텔 블루": "soft pastel blue",
-        "파스텔 핑크": "soft pastel pink",
-        "민트 그린": "mint green, seafoam",
-        "따뜻한 노랑": "warm yellow, golden yellow",
-        "네이비": "navy blue, deep blue",
-        "골드": "gold, champagne gold",
-        "코랄 핑크": "coral pink, soft coral",
-        "그레이": "gray, neutral gray",
-        "화이트": "white, clean white",
-        "블랙": "black, elegant black",
-        "베이지": "beige, warm beige",
-        "그린": "green, fresh green",
-        "오렌지": "orange, warm orange",
-        "레드": "red, vibrant red",
-        "퍼플": "purple, elegant purple",
-        "그라데이션": "gradient",
-    }
-
-    for kr, en in color_map.items():
+    # Fast path: the whole value is a single known term
+    exact = _COLOR_MAP.get(korean_color)
+    if exact is not None:
+        return exact
+
+    for kr, en in _COLOR_MAP.items():
         if kr in korean_color:
             return korean_color.replace(kr, en)
 
     return korean_color
 
 
+@functools.lru_cache(maxsize=256)
 def translate_mood(korean_mood: str) -> str:
     """Convert Korean mood description to English"""
-    mood_map = {
-        "따뜻한": "warm, cozy",
-        "친근한": "friendly, approachable",
-        "전문적": "professional, expert",
-        "신뢰감": "trustworthy, reliable",
-        "깔끔한": "clean, neat",
-        "모던한": "modern, contemporary",
-        "세련된": "sophisticated, elegant",
-        "밝은": "bright, cheerful",
-        "차분한": "calm, serene",
-        "활기찬": "energetic, lively",
-        "감성적": "emotional, sentimental",
-        "정보성": "informative, educational",
-        "눈에 띄는": "eye-catching, attention-grabbing",
-        "클릭 유도": "click-worthy, engaging",
-        "희망적": "hopeful, optimistic",
-        "사랑스러운": "lovely, adorable",
-    }
+    # Fast path: the whole value is a single known term
+    exact = _MOOD_MAP.get(korean_mood)
+    if exact is not None:
+        return exact
 
     result = korean_mood
-    for kr, en in mood_map.items():
+    for kr, en in _MOOD_MAP.items():
         if kr in result:
             result = result.replace(kr, en)
 
     return result
 
 
+@functools.lru_cache(maxsize=256)
 def translate_format(korean_format: str) -> str:
     """Convert Korean format description to English"""
-    format_map = {
-        "인포그래픽": "infographic, data visualization",
-        "일러스트": "illustration, illustrated",
-        "사진풍": "photographic, photo-realistic",
-        "플랫디자인": "flat design, minimalist",
-        "모던 썸네일": "modern thumbnail design",
-        "차트": "chart, graph",
-        "다이어그램": "diagram, flowchart",
-        "체크리스트": "checklist, list design",
-        "비교표": "comparison table, comparison chart",
-        "프로세스": "process diagram, step-by-step",
-    }
+    # Fast path: the whole value is a single known term
+    exact = _FORMAT_MAP.get(korean_format)
+    if exact is not None:
+        return exact
 
     result = korean_format
-    for kr, en in format_map.items():
+    for kr, en in _FORMAT_MAP.items():
         if kr in result:
             result = result.replace(kr, en)
 
     return result
 
 
+# Style guide keys rendered into the Gemini prompt, in output order
+_STYLE_PROMPT_FIELDS = (
+    ("색상", "Color scheme", translate_color),
+    ("분위기", "Mood", translate_mood),
+    ("형식", "Style", translate_format),
+)
+
+
+def _build_style_parts(style_guide: Dict[str, str]) -> List[str]:
+    """Translate style guide entries into English prompt fragments"""
+    style_parts = []
+    for key, label, translate in _STYLE_PROMPT_FIELDS:
+        value = style_guide.get(key)
+        if value is not None:
+            style_parts.append(f"{label}: {translate(value)}")
+    return style_parts
+
+
 def parse_image_guide_markdown(content: str) -> List[ImageGuideItem]:
     """
     Parse image guide markdown and return list of image items.
@@ -367,10 +478,7 @@ def parse_image_guide_markdown(content: str) -> List[ImageGuideItem]:
     """
     items = []
 
-    # Split image blocks (by ━ separator)
-    blocks = re.split(r"━{20,}", content)
-
-    for block in blocks:
+    for block in _iter_image_blocks(content):
         if not block.strip():
             continue
 
@@ -381,6 +489,17 @@ def parse_image_guide_markdown(content: str) -> List[ImageGuideItem]:
     return items
 
 
+def _iter_image_blocks(content: str) -> Iterator[str]:
+    """Yield image blocks split by ━ separator, without materializing the split"""
+    start = 0
+    # A guide without a separator is a single block
+    if _BLOCK_SEPARATOR in content:
+        for separator in _BLOCK_SEPARATOR_RE.finditer(content):
+            yield content[start:separator.start()]
+            start = separator.end()
+    yield content[start:]
+
+
 def _parse_image_block(block: str) -> Optional[ImageGuideItem]:
     """Parse single image block"""
     lines = block.strip().split("\n")
@@ -389,10 +508,10 @@ def _parse_image_block(block: str) -> Optional[ImageGuideItem]:
         return None
 
     # Extract image number and role from first line
-    header_match = re.match(r"\[이미지\s*(\d+)\]\s*(.+)", lines[0])
+    header_match = _BLOCK_HEADER_RE.match(lines[0])
     if not header_match:
         # Also handle [썸네일] format
-        header_match = re.match(r"\[(\w+)\]\s*(.+)", lines[0])
+        header_match = _BLOCK_HEADER_ALT_RE.match(lines[0])
         if not header_match:
             return None
         index = 0
@@ -401,14 +520,12 @@ def _parse_image_block(block: str) -> Optional[ImageGuideItem]:
         index = int(header_match.group(1))
         role = header_match.group(2)
 
-    # Determine mode
+    # Determine mode (🎨 / "AI 생성" blocks fall through to the default)
     mode = "B"  # Default: AI generation
     if "📷" in block or "참고 이미지" in block or "다운로드된 이미지" in block:
         mode = "A"
     elif "🔷" in block or "SVG 생성" in block:
         mode = "C"
-    elif "🎨" in block or "AI 생성" in block or "생성 필요" in block:
-        mode = "B"
 
     # Skip if not AI generation mode
     if mode != "B":
@@ -420,28 +537,29 @@ def _parse_image_block(block: str) -> Optional[ImageGuideItem]:
 
     # Extract Korean description
     korean_desc = ""
-    desc_match = re.search(r"\[한글 설명\]\s*\n(.+?)(?=\n\[|$)", block, re.DOTALL)
+    desc_match = _BLOCK_DESC_RE.search(block)
     if desc_match:
         korean_desc = desc_match.group(1).strip()
 
     # Extract AI generation prompt
     prompt = ""
-    prompt_match = re.search(r"\[AI 생성 프롬프트\]\s*\n(.+?)(?=\n\[|$)", block, re.DOTALL)
+    prompt_match = _BLOCK_PROMPT_RE.search(block)
     if prompt_match:
         prompt = prompt_match.group(1).strip()
 
     # Extract style guide
     style_guide = {}
-    style_match = re.search(r"\[스타일 가이드\]\s*\n(.+?)(?=━|$)", block, re.DOTALL)
+    style_match = _BLOCK_STYLE_RE.search(block)
     if style_match:
         style_text = style_match.group(1)
-        for line in style_text.split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip().lstrip("-").strip()
-                value = value.strip()
-                if key and value:
-                    style_guide[key] = value
+        for line in style_text.splitlines():
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            key = key.strip().lstrip("-").strip()
+            value = value.strip()
+            if key and value:
+                style_guide[key] = value
 
     return ImageGuideItem(
         index=index,
@@ -478,14 +596,10 @@ def extract_gemini_prompts(
             continue
 
         # Generate Gemini optimized prompt
-        optimized_prompt = convert_to_gemini_prompt({
-            "korean_description": item.korean_description,
-            "prompt": item.prompt,
-            "style_guide": item.style_guide,
-        })
+        optimized_prompt = convert_to_gemini_prompt(item)
 
         # Generate filename
-        filename = f"{item.index:02d}_{sanitize_filename(item.role)}.png"
+        filename = _image_filename(item)
 
         # Extract ratio
         aspect_ratio = item.style_guide.get("비율", "16:9")
@@ -494,18 +608,35 @@ def extract_gemini_prompts(
             prompt=optimized_prompt,
             filename=filename,
             aspect_ratio=aspect_ratio,
-            style_hints=", ".join(item.style_guide.values()) if item.style_guide else "",
+            style_hints=", ".join(item.style_guide.values()),
         ))
 
     return prompts
 
 
+def _image_filename(item: ImageGuideItem) -> str:
+    """Output filename for an image guide item (e.g. 01_썸네일.png)"""
+    return f"{item.index:02d}_{sanitize_filename(item.role)}.png"
+
+
+@functools.lru_cache(maxsize=512)
 def sanitize_filename(name: str) -> str:
     """Remove characters not allowed in filenames"""
+    # Already clean: nothing to remove, replace or truncate
+    if len(name) <= 50 and not _FILENAME_UNCLEAN_RE.search(name):
+        return name
+
     # Remove special characters
-    name = re.sub(r'[<>:"/\\|?*]', "", name)
-    # Replace spaces with underscores
-    name = re.sub(r"\s+", "_", name)
+    name = _FILENAME_INVALID_RE.sub("", name)
+    # Replace whitespace runs with underscores (str.split() splits on the
+    # same characters as \s, without a regex pass)
+    words = name.split()
+    collapsed = "_".join(words)
+    if name[:1].isspace():
+        collapsed = "_" + collapsed
+    if words and name[-1:].isspace():
+        collapsed += "_"
+    name = collapsed
     # Truncate long names
     if len(name) > 50:
         name = name[:50]
@@ -524,15 +655,34 @@ def generate_image_prompts_for_batch(
     Returns:
         List in format [{"prompt": "...", "filename": "..."}, ...]
     """
-    gemini_prompts = extract_gemini_prompts(image_guide_content)
+    return list(iter_batch_prompts(image_guide_content))
+
+
+def iter_batch_prompts(image_guide_content: str) -> Iterator[Dict[str, str]]:
+    """
+    Lazily yield batch prompts, one per AI-generation image.
+
+    Same output as generate_image_prompts_for_batch(), but each block goes
+    straight from parse to prompt dict without building GeminiPrompt objects.
+
+    Args:
+        image_guide_content: Image guide markdown content
+
+    Yields:
+        {"prompt": "...", "filename": "..."}
+    """
+    for block in _iter_image_blocks(image_guide_content):
+        if not block.strip():
+            continue
+
+        item = _parse_image_block(block)
+        if item is None or item.mode != "B" or not item.prompt:
+            continue
 
-    return [
-        {
-            "prompt": gp.prompt,
-            "filename": gp.filename,
+        yield {
+            "prompt": convert_to_gemini_prompt(item),
+            "filename": _image_filename(item),
         }
-        for gp in gemini_prompts
-    ]
 
 
 def get_prompt_for_thumbnail(
@@ -631,7 +781,7 @@ def get_prompt_for_process(
     Returns:
         Process diagram prompt
     """
-    steps_str = " → ".join([f"Step {i+1}: {s}" for i, s in enumerate(steps[:5])])
+    steps_str = " → ".join([f"Step {i}: {s}" for i, s in enumerate(steps[:5], start=1)])
 
     return (
         f"Create a step-by-step process diagram. "
@@ -663,59 +813,18 @@ def extract_watermark_config(content: str) -> Optional[WatermarkConfig]:
     """
     config_kwargs = {}
 
-    # Extract watermark_text
-    text_match = re.search(
-        r"watermark_text[:\s]*[\"'](.+?)[\"']",
-        content,
-        re.IGNORECASE
-    )
-    if text_match:
-        config_kwargs["watermark_text"] = text_match.group(1)
-
-    # Extract watermark_position
-    position_match = re.search(
-        r"watermark_position[:\s]*[\"'](.+?)[\"']",
-        content,
-        re.IGNORECASE
-    )
-    if position_match:
-        config_kwargs["watermark_position"] = position_match.group(1)
-
-    # Extract watermark_margin_bottom
-    margin_match = re.search(
-        r"watermark_margin_bottom[:\s]*(\d+)",
-        content,
-        re.IGNORECASE
-    )
-    if margin_match:
-        config_kwargs["watermark_margin_bottom"] = int(margin_match.group(1))
-
-    # Extract watermark_font_size
-    font_size_match = re.search(
-        r"watermark_font_size[:\s]*(\d+)",
-        content,
-        re.IGNORECASE
-    )
-    if font_size_match:
-        config_kwargs["watermark_font_size"] = int(font_size_match.group(1))
-
-    # Extract watermark_font_color
-    color_match = re.search(
-        r"watermark_font_color[:\s]*[\"'](.+?)[\"']",
-        content,
-        re.IGNORECASE
-    )
-    if color_match:
-        config_kwargs["watermark_font_color"] = color_match.group(1)
-
-    # Extract watermark_enabled
-    enabled_match = re.search(
-        r"watermark_enabled[:\s]*(true|false)",
-        content,
-        re.IGNORECASE
-    )
-    if enabled_match:
-        config_kwargs["watermark_enabled"] = enabled_match.group(1).lower() == "true"
+    # Scan once; like separate searches, the first occurrence of each field wins
+    for match in _WATERMARK_FIELD_RE.finditer(content):
+        if match.group("str_key"):
+            key = "watermark_" + match.group("str_key").lower()
+            config_kwargs.setdefault(key, match.group("str_value"))
+        elif match.group("int_key"):
+            key = "watermark_" + match.group("int_key").lower()
+            config_kwargs.setdefault(key, int(match.group("int_value")))
+        else:
+            config_kwargs.setdefault(
+                "watermark_enabled", match.group("enabled").lower() == "true"
+            )
 
     # Return config if any watermark settings found, otherwise return default
     if config_kwargs:
@@ -5,13 +5,22 @@ Handles automatic output directory creation, metadata initialization, etc.
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import get_config, get_config_value
 from .utils import normalize_filename, get_today_date
 
+# Raw .metadata.json bytes per file, invalidated by (st_mtime_ns, st_size)
+_METADATA_CACHE: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
 
 def create_project_structure(
     topic: str,
@@ -104,48 +113,99 @@ def create_metadata_file(
     }
 
     metadata_path = project_path / ".metadata.json"
-
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    _write_metadata(metadata_path, metadata)
 
     return metadata_path
 
 
+def _read_metadata(metadata_path: Path) -> Optional[Dict[str, Any]]:
+    """Read metadata file, reusing the raw bytes while the file is unchanged
+
+    Every call parses a fresh dict, so callers may modify the result.
+    """
+    try:
+        stat = metadata_path.stat()
+    except FileNotFoundError:
+        _METADATA_CACHE.pop(metadata_path, None)
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _METADATA_CACHE.get(metadata_path)
+    if cached is not None and cached[0] == key:
+        data = cached[1]
+    else:
+        data = metadata_path.read_bytes()
+        _METADATA_CACHE[metadata_path] = (key, data)
+
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_metadata(metadata_path: Path, metadata: Dict[str, Any]) -> None:
+    """Write metadata file atomically (temp file + os.replace) and refresh cache"""
+    tmp_path = metadata_path.with_suffix(".json.tmp")
+    # Compact, machine-read format (see print_project_info() for a readable view).
+    # The encoders differ on floats: exponents are spelled 1e16 vs json's 1e+16
+    # (same value), and NaN/Infinity become null under orjson but NaN/Infinity
+    # under json, which orjson cannot read back. The passthrough options make
+    # orjson raise TypeError for datetime and dataclass values like json does.
+    if orjson is not None:
+        data = orjson.dumps(
+            metadata,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    else:
+        data = json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp_path.write_bytes(data)
+    # os.replace keeps the temp file's mtime and size, so stat it before the swap
+    stat = tmp_path.stat()
+    os.replace(tmp_path, metadata_path)
+
+    # Only cached once the file is in place: a failed write leaves the cache as it was
+    _METADATA_CACHE[metadata_path] = ((stat.st_mtime_ns, stat.st_size), data)
+
+
+def _deep_update(base: dict, updates: dict) -> None:
+    """Merge updates into base (nested dicts merged, others replaced)"""
+    # Explicit stack instead of recursion: one frame however deep the tree is
+    stack = [(base, updates)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+
+
 def update_metadata(
     project_path: Path,
-    updates: Dict[str, Any]
+    updates: Union[Dict[str, Any], List[Dict[str, Any]]]
 ) -> Dict[str, Any]:
     """
     Update metadata file.
 
     Args:
         project_path: Project directory path
-        updates: Content to update
+        updates: Content to update, or a list of updates applied in order
+            (one read, one timestamp and one write for the whole batch)
 
     Returns:
         Updated metadata
     """
     metadata_path = project_path / ".metadata.json"
-
-    if metadata_path.exists():
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
-    else:
+    metadata = _read_metadata(metadata_path)
+    if metadata is None:
         metadata = {}
 
     # Deep update
-    def deep_update(base: dict, updates: dict):
-        for key, value in updates.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                deep_update(base[key], value)
-            else:
-                base[key] = value
-
-    deep_update(metadata, updates)
+    for update in ([updates] if isinstance(updates, dict) else updates):
+        _deep_update(metadata, update)
     metadata["updated_at"] = datetime.now().isoformat()
 
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    _write_metadata(metadata_path, metadata)
 
     return metadata
 
@@ -160,13 +220,7 @@ def load_metadata(project_path: Path) -> Optional[Dict[str, Any]]:
     Returns:
         Metadata dictionary (None if not found)
     """
-    metadata_path = project_path / ".metadata.json"
-
-    if not metadata_path.exists():
-        return None
-
-    with open(metadata_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_metadata(project_path / ".metadata.json")
 
 
 def find_existing_project(
@@ -208,7 +262,8 @@ def find_existing_project(
 def list_projects(
     base_dir: Optional[str] = None,
     date: Optional[str] = None,
-    config: Optional[Dict] = None
+    config: Optional[Dict] = None,
+    include_metadata: bool = True
 ) -> list:
     """
     Return list of projects.
@@ -217,6 +272,7 @@ def list_projects(
         base_dir: Base directory
         date: Specific date (all dates if not provided)
         config: Configuration dictionary
+        include_metadata: Load each project's metadata (None in "metadata" if False)
 
     Returns:
         Project info list
@@ -234,21 +290,28 @@ def list_projects(
 
     projects = []
 
+    # os.scandir() entries carry the file type from the directory listing,
+    # so is_dir() needs no extra stat per entry
     if date:
-        date_dirs = [base_path / date] if (base_path / date).exists() else []
+        date_names = [date] if (base_path / date).is_dir() else []
     else:
-        date_dirs = [d for d in base_path.iterdir() if d.is_dir()]
-
-    for date_dir in sorted(date_dirs, reverse=True):
-        for project_dir in date_dir.iterdir():
-            if project_dir.is_dir():
-                metadata = load_metadata(project_dir)
-                projects.append({
-                    "path": project_dir,
-                    "date": date_dir.name,
-                    "topic": project_dir.name,
-                    "metadata": metadata,
-                })
+        with os.scandir(base_path) as entries:
+            date_names = [entry.name for entry in entries if entry.is_dir()]
+
+    for date_name in sorted(date_names, reverse=True):
+        date_dir = base_path / date_name
+        with os.scandir(date_dir) as entries:
+            project_names = [entry.name for entry in entries if entry.is_dir()]
+
+        for project_name in project_names:
+            project_dir = date_dir / project_name
+            metadata = load_metadata(project_dir) if include_metadata else None
+            projects.append({
+                "path": project_dir,
+                "date": date_name,
+                "topic": project_name,
+                "metadata": metadata,
+            })
 
     return projects
 
@@ -4,16 +4,22 @@ Shared type definitions for the naver-blog-automation project.
 Centralizes common dataclasses to avoid duplication across modules.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
+# @dataclass(**DATACLASS_SLOTS): __slots__ instances (no per-instance __dict__)
+# on Python 3.10+, plain dataclasses on older interpreters
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # ==============================================================================
 # Image Generation Types
 # ==============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImageResult:
     """Result of a single image generation operation"""
 
@@ -30,7 +36,7 @@ class ImageResult:
         return f"❌ {self.error_message}"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchResult:
     """Result of batch image generation"""
 
@@ -53,7 +59,7 @@ class BatchResult:
 # ==============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TextStyleConfig:
     """Style configuration for text overlay (font, color, position)"""
 
@@ -71,7 +77,7 @@ class TextStyleConfig:
     background_box_padding: int = 20
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TextElement:
     """Single text element for overlay"""
 
@@ -93,7 +99,7 @@ class TextElement:
     background_box_radius: int = 10
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OverlayConfig:
     """Configuration for text overlay operation (paths, dimensions)"""
 
@@ -109,7 +115,7 @@ class OverlayConfig:
 # ==============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Result of content validation"""
 
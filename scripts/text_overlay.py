@@ -2,7 +2,8 @@
 Text Overlay Module
 
 Adds text overlay to images using SVG composition and exports to PNG.
-Uses svg-canvas MCP tools for SVG generation.
+Uses svg-canvas MCP tools for SVG generation. When the requested font can
+be resolved locally, text is drawn directly with Pillow instead.
 
 Workflow:
 1. Load background image (PNG/JPG)
@@ -13,14 +14,51 @@ Workflow:
 """
 
 import base64
+import functools
+import importlib.util
 import os
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from PIL import Image
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 import tempfile
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+# Background bytes read per base64 chunk (multiple of 3)
+_DATA_URI_CHUNK_SIZE = 3 * 64 * 1024
+
+# SIMD base64 encoder when installed (same output as the stdlib)
+_b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+
+# CSS rgba() with a 0-1 alpha (ImageColor only accepts 0-255)
+_RGBA_RE = re.compile(r"rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*([\d.]+)\s*\)")
+
+# SVG text-anchor -> Pillow anchor (y is the baseline in both)
+_PIL_ANCHORS = {"start": "ls", "middle": "ms", "end": "rs"}
+
+# Font files tried for known families when fontconfig is unavailable: (regular, bold)
+_FONT_FILES = {
+    "pretendard": ("Pretendard-Regular.otf", "Pretendard-Bold.otf"),
+    "nanum gothic": ("NanumGothic.ttf", "NanumGothicBold.ttf"),
+    "nanumgothic": ("NanumGothic.ttf", "NanumGothicBold.ttf"),
+    "noto sans kr": ("NotoSansKR-Regular.otf", "NotoSansKR-Bold.otf"),
+    "malgun gothic": ("malgun.ttf", "malgunbd.ttf"),
+    "apple sd gothic neo": ("AppleSDGothicNeo.ttc", "AppleSDGothicNeo.ttc"),
+}
+_FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+# Unassigned code point: every font draws it with its .notdef (missing glyph) box
+_NOTDEF_PROBE = "\u0378"
+
 
 @dataclass
 class TextElement:
@@ -53,11 +91,99 @@ class TextOverlayConfig:
     width: int = 0  # Auto-detect from image if 0
     height: int = 0  # Auto-detect from image if 0
     text_elements: List[TextElement] = field(default_factory=list)
+    backend: str = "pillow"  # "pillow" or "svg" (pillow falls back to svg if the font is missing or lacks glyphs)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_color(value: str) -> Tuple[int, int, int, int]:
+    """Parse a CSS color (hex, name, rgb(), rgba() with 0-1 alpha) to RGBA."""
+    m = _RGBA_RE.fullmatch(value.strip())
+    if m:
+        alpha = min(max(round(float(m.group(4)) * 255), 0), 255)
+        return int(m.group(1)), int(m.group(2)), int(m.group(3)), alpha
+    rgb = ImageColor.getrgb(value)
+    return rgb if len(rgb) == 4 else (*rgb, 255)
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_font_path(font_family: str, bold: bool) -> Optional[str]:
+    """Resolve a CSS font-family list to a font file, or None if not found."""
+    families = [name.strip().strip("'\"") for name in font_family.split(",")]
+
+    # Explicit font file paths
+    for name in families:
+        if name.lower().endswith(_FONT_EXTENSIONS) and os.path.isfile(name):
+            return name
+
+    # fontconfig resolves the list the same way the SVG renderers do
+    if _has_command("fc-match"):
+        pattern = f"{','.join(families)}:weight={'bold' if bold else 'regular'}:lang=ko"
+        try:
+            result = subprocess.run(
+                ["fc-match", "-f", "%{file}", pattern],
+                capture_output=True, text=True, timeout=10
+            )
+            if result.returncode == 0 and os.path.isfile(result.stdout):
+                return result.stdout
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    # Known font files in the system font directories (Pillow searches them)
+    for name in families:
+        files = _FONT_FILES.get(name.lower())
+        if not files:
+            continue
+        try:
+            return ImageFont.truetype(files[bold]).path
+        except OSError:
+            continue
+
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(path: str, size: int) -> "ImageFont.FreeTypeFont":
+    """Load a TrueType font once per (path, size)."""
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _font_covers(path: str, text: str) -> bool:
+    """Whether the font has a glyph for every visible character of text."""
+    # Pillow has no per-glyph fallback, so a missing glyph would draw as a box
+    font = _load_font(path, 32)
+
+    def glyph(ch: str) -> Tuple[Tuple[int, int], bytes]:
+        mask = font.getmask(ch)
+        return mask.size, bytes(mask)
+
+    notdef = glyph(_NOTDEF_PROBE)
+    return all(ch.isspace() or glyph(ch) != notdef for ch in set(text))
+
+
+@functools.lru_cache(maxsize=None)
+def _has_command(name: str) -> bool:
+    """Whether a command-line tool is on PATH (checked once per process)."""
+    return shutil.which(name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    """Whether a Python module is importable (checked once per process)."""
+    return importlib.util.find_spec(name) is not None
+
+
+def _is_bold(font_weight: Any) -> bool:
+    """Whether a CSS font-weight value (str or int) selects a bold face."""
+    weight = str(font_weight).strip().lower()
+    if weight.isdigit():
+        return int(weight) >= 600
+    return weight in ("bold", "bolder")
 
 
 class TextOverlayProcessor:
     """
-    Processor for adding text overlay to images via SVG composition.
+    Processor for adding text overlay to images via Pillow or SVG composition.
 
     Example usage:
         processor = TextOverlayProcessor()
@@ -80,6 +206,15 @@ class TextOverlayProcessor:
         result = processor.process(config)
     """
 
+    # Converter method names, in order of preference
+    _CONVERTERS = (
+        "_convert_with_resvg",
+        "_convert_with_rsvg",
+        "_convert_with_cairosvg",
+        "_convert_with_inkscape",
+        "_convert_with_svglib",
+    )
+
     def __init__(self, temp_dir: Optional[str] = None):
         """
         Initialize TextOverlayProcessor.
@@ -88,6 +223,7 @@ class TextOverlayProcessor:
             temp_dir: Directory for temporary files (default: system temp)
         """
         self.temp_dir = temp_dir or tempfile.gettempdir()
+        self._last_converter: Optional[str] = None
 
     def process(self, config: TextOverlayConfig) -> Dict[str, Any]:
         """
@@ -100,6 +236,12 @@ class TextOverlayProcessor:
             Dict with 'success', 'output_path', 'error' keys
         """
         try:
+            # Nothing to draw: pass the background through without rendering
+            if not any(elem.text for elem in config.text_elements):
+                result = self._copy_background(config)
+                if result is not None:
+                    return result
+
             # 1. Get image dimensions
             width, height = self._get_image_dimensions(
                 config.background_image_path,
@@ -107,28 +249,32 @@ class TextOverlayProcessor:
                 config.height
             )
 
-            # 2. Generate SVG content
-            svg_content = self._generate_svg(
-                config.background_image_path,
-                width,
-                height,
-                config.text_elements
-            )
-
-            # 3. Save temporary SVG
-            svg_path = Path(self.temp_dir) / f"overlay_{os.getpid()}.svg"
-            with open(svg_path, "w", encoding="utf-8") as f:
-                f.write(svg_content)
-
-            # 4. Convert SVG to PNG
-            output_path = Path(config.output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            success = self._convert_svg_to_png(str(svg_path), str(output_path), width, height)
-
-            # 5. Cleanup
-            if svg_path.exists():
-                svg_path.unlink()
+            # 2. Draw directly with Pillow when the fonts resolve
+            if config.backend == "pillow":
+                result = self._render_pillow(config, width, height)
+                if result is not None:
+                    return result
+
+            # 3. Stream SVG content into a temporary file
+            # (unique name: process_many runs in threads)
+            fd, svg_name = tempfile.mkstemp(prefix="overlay_", suffix=".svg", dir=self.temp_dir)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.writelines(self._iter_svg(
+                        config.background_image_path,
+                        width,
+                        height,
+                        config.text_elements
+                    ))
+
+                # 4. Convert SVG to PNG
+                output_path = Path(config.output_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                success = self._convert_svg_to_png(svg_name, str(output_path), width, height)
+            finally:
+                # 5. Cleanup (also on failure: every temp name is unique)
+                os.unlink(svg_name)
 
             if success:
                 return {
@@ -150,6 +296,61 @@ class TextOverlayProcessor:
                 "error": str(e)
             }
 
+    def process_many(
+        self,
+        configs: List[TextOverlayConfig],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several text overlay operations concurrently.
+
+        SVG rasterization runs in C libraries or external converter processes,
+        so a thread pool overlaps the per-image conversions.
+
+        Args:
+            configs: TextOverlayConfig per output image
+            max_workers: Thread count (default: min(len(configs), CPU count))
+
+        Returns:
+            List of result dicts ('success', 'output_path', 'error'), in input order
+        """
+        if len(configs) <= 1:
+            return [self.process(config) for config in configs]
+
+        workers = max_workers or min(len(configs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process, configs))
+
+    def _copy_background(self, config: TextOverlayConfig) -> Optional[Dict[str, Any]]:
+        """
+        Write the background unchanged to output_path (no-op if same file).
+
+        Returns None when the background has to be scaled to config.width x
+        config.height, which only the rendering path does.
+        """
+        background_path = Path(config.background_image_path)
+        output_path = Path(config.output_path)
+
+        with Image.open(background_path) as img:
+            if config.width > 0 and config.height > 0 and img.size != (config.width, config.height):
+                return None
+
+            if background_path.resolve() != output_path.resolve():
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                if background_path.suffix.lower() == output_path.suffix.lower():
+                    shutil.copyfile(background_path, output_path)
+                else:
+                    # Different format (e.g. PNG background, JPEG output): re-encode
+                    if output_path.suffix.lower() in (".jpg", ".jpeg") and img.mode not in ("RGB", "L", "CMYK"):
+                        img = img.convert("RGB")
+                    img.save(output_path)
+
+        return {
+            "success": True,
+            "output_path": str(output_path),
+            "error": None
+        }
+
     def _get_image_dimensions(
         self,
         image_path: str,
@@ -163,6 +364,85 @@ class TextOverlayProcessor:
         with Image.open(image_path) as img:
             return img.size
 
+    def _render_pillow(
+        self,
+        config: TextOverlayConfig,
+        width: int,
+        height: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Draw text elements directly onto the background with Pillow.
+
+        Returns None when the overlay needs the SVG path: a font that cannot
+        be resolved or has no glyph for some character (fontconfig always
+        returns a font, so coverage is what decides), a color or font
+        setting Pillow does not handle, or a background that has to be
+        scaled to a different size.
+        """
+        elements = [elem for elem in config.text_elements if elem.text]
+
+        # Resolve fonts and colors up front so any miss falls back cleanly
+        styles = []
+        try:
+            for elem in elements:
+                font_path = _resolve_font_path(elem.font_family, _is_bold(elem.font_weight))
+                if font_path is None or not _font_covers(font_path, elem.text):
+                    return None
+                styles.append((
+                    _load_font(font_path, elem.font_size),
+                    _parse_color(elem.fill),
+                    _parse_color(elem.shadow_color) if elem.shadow else None,
+                    _parse_color(elem.background_box_color) if elem.background_box else None,
+                ))
+        except Exception:
+            return None
+
+        with Image.open(config.background_image_path) as img:
+            if img.size != (width, height):
+                return None
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            base = img.convert("RGBA" if has_alpha else "RGB")
+
+        # RGB: blend straight into the background; RGBA: draw on a layer and composite
+        layer = Image.new("RGBA", base.size, (0, 0, 0, 0)) if has_alpha else None
+        draw = ImageDraw.Draw(layer) if has_alpha else ImageDraw.Draw(base, "RGBA")
+
+        for elem, (font, fill, shadow_fill, box_fill) in zip(elements, styles):
+            text = " ".join(elem.text.split())  # SVG collapses whitespace
+            anchor = _PIL_ANCHORS.get(elem.text_anchor, "ms")
+
+            if box_fill is not None:
+                left, top, right, bottom = draw.textbbox((elem.x, elem.y), text, font=font, anchor=anchor)
+                pad = elem.background_box_padding
+                draw.rounded_rectangle(
+                    (left - pad, top - pad, right + pad, bottom + pad),
+                    radius=elem.background_box_radius,
+                    fill=box_fill
+                )
+
+            if shadow_fill is not None:
+                draw.text(
+                    (elem.x + elem.shadow_offset_x, elem.y + elem.shadow_offset_y),
+                    text, font=font, fill=shadow_fill, anchor=anchor
+                )
+
+            draw.text((elem.x, elem.y), text, font=font, fill=fill, anchor=anchor)
+
+        if layer is not None:
+            base.alpha_composite(layer)
+
+        output_path = Path(config.output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if base.mode == "RGBA" and output_path.suffix.lower() in (".jpg", ".jpeg"):
+            base = base.convert("RGB")
+        base.save(output_path)
+
+        return {
+            "success": True,
+            "output_path": str(output_path),
+            "error": None
+        }
+
     def _generate_svg(
         self,
         background_path: str,
@@ -171,11 +451,22 @@ class TextOverlayProcessor:
         text_elements: List[TextElement]
     ) -> str:
         """Generate SVG content with background image and text overlay."""
-        # Convert background image to base64 data URI
-        image_data_uri = self._image_to_data_uri(background_path)
+        return "".join(self._iter_svg(background_path, width, height, text_elements))
+
+    def _iter_svg(
+        self,
+        background_path: str,
+        width: int,
+        height: int,
+        text_elements: List[TextElement]
+    ) -> Iterator[str]:
+        """
+        Yield SVG content in pieces.
 
-        # Build SVG content
-        svg_parts = [
+        The background data URI is yielded in chunks so writing the SVG to
+        a file never holds the whole base64 string in memory.
+        """
+        yield "\n".join([
             f'<?xml version="1.0" encoding="UTF-8"?>',
             f'<svg xmlns="http://www.w3.org/2000/svg" '
             f'xmlns:xlink="http://www.w3.org/1999/xlink" '
@@ -186,20 +477,31 @@ class TextOverlayProcessor:
             f'    </filter>',
             f'  </defs>',
             f'  <!-- Background Image -->',
-            f'  <image href="{image_data_uri}" x="0" y="0" width="{width}" height="{height}" preserveAspectRatio="xMidYMid slice"/>',
-        ]
+            f'  <image href="',
+        ])
+        yield from self._iter_data_uri(background_path)
+        yield f'" x="0" y="0" width="{width}" height="{height}" preserveAspectRatio="xMidYMid slice"/>'
+
+        svg_parts = []
 
         # Add text elements
         for i, elem in enumerate(text_elements):
             svg_parts.append(f'  <!-- Text Element {i + 1} -->')
 
+            # Shared by the shadow and main <text> nodes
+            escaped_text = self._escape_xml(elem.text)
+            font_attrs = (
+                f'font-family="{elem.font_family}" font-size="{elem.font_size}px" '
+                f'font-weight="{elem.font_weight}"'
+            )
+
             # Add background box if enabled
             if elem.background_box:
-                # Estimate text width (rough approximation)
-                text_width = len(elem.text) * elem.font_size * 0.6
-                text_height = elem.font_size * 1.2
+                # Estimate text width (rough approximation, whole pixels)
+                text_width = len(elem.text) * elem.font_size * 3 // 5
+                text_height = elem.font_size * 6 // 5
 
-                box_x = elem.x - text_width / 2 - elem.background_box_padding if elem.text_anchor == "middle" else elem.x - elem.background_box_padding
+                box_x = elem.x - text_width // 2 - elem.background_box_padding if elem.text_anchor == "middle" else elem.x - elem.background_box_padding
                 box_y = elem.y - elem.font_size - elem.background_box_padding
 
                 svg_parts.append(
@@ -214,27 +516,27 @@ class TextOverlayProcessor:
             if elem.shadow:
                 svg_parts.append(
                     f'  <text x="{elem.x + elem.shadow_offset_x}" y="{elem.y + elem.shadow_offset_y}" '
-                    f'font-family="{elem.font_family}" font-size="{elem.font_size}px" '
-                    f'font-weight="{elem.font_weight}" fill="{elem.shadow_color}" '
-                    f'text-anchor="{elem.text_anchor}">{self._escape_xml(elem.text)}</text>'
+                    f'{font_attrs} fill="{elem.shadow_color}" '
+                    f'text-anchor="{elem.text_anchor}">{escaped_text}</text>'
                 )
 
             # Add main text
             svg_parts.append(
                 f'  <text x="{elem.x}" y="{elem.y}" '
-                f'font-family="{elem.font_family}" font-size="{elem.font_size}px" '
-                f'font-weight="{elem.font_weight}" fill="{elem.fill}" '
-                f'text-anchor="{elem.text_anchor}">{self._escape_xml(elem.text)}</text>'
+                f'{font_attrs} fill="{elem.fill}" '
+                f'text-anchor="{elem.text_anchor}">{escaped_text}</text>'
             )
 
         svg_parts.append('</svg>')
-        return '\n'.join(svg_parts)
+        yield "\n"
+        yield '\n'.join(svg_parts)
 
     def _image_to_data_uri(self, image_path: str) -> str:
         """Convert image file to base64 data URI."""
-        with open(image_path, "rb") as f:
-            image_data = f.read()
+        return "".join(self._iter_data_uri(image_path))
 
+    def _iter_data_uri(self, image_path: str) -> Iterator[str]:
+        """Yield a base64 data URI for an image file in chunks."""
         # Detect MIME type
         ext = Path(image_path).suffix.lower()
         mime_types = {
@@ -245,10 +547,15 @@ class TextOverlayProcessor:
             ".webp": "image/webp",
         }
         mime_type = mime_types.get(ext, "image/png")
+        yield f"data:{mime_type};base64,"
 
-        # Encode to base64
-        b64_data = base64.b64encode(image_data).decode("utf-8")
-        return f"data:{mime_type};base64,{b64_data}"
+        # Encode to base64 (chunk size is a multiple of 3: no padding mid-stream)
+        with open(image_path, "rb") as f:
+            while True:
+                chunk = f.read(_DATA_URI_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield _b64encode(chunk).decode("ascii")
 
     def _escape_xml(self, text: str) -> str:
         """Escape special XML characters."""
@@ -271,12 +578,60 @@ class TextOverlayProcessor:
         """
         Convert SVG to PNG using available tools.
 
-        Tries multiple methods in order:
-        1. cairosvg (Python library)
+        Tries multiple methods in order, starting with the one that
+        succeeded last time:
+        1. resvg (command line)
         2. rsvg-convert (command line)
-        3. inkscape (command line)
+        3. cairosvg (Python library)
+        4. inkscape (command line)
+        5. svglib + reportlab (fallback)
         """
-        # Method 1: cairosvg
+        converters = self._CONVERTERS
+        last = self._last_converter
+        if last is not None and last != converters[0]:
+            converters = (last,) + tuple(name for name in converters if name != last)
+
+        for name in converters:
+            if getattr(self, name)(svg_path, output_path, width, height):
+                self._last_converter = name
+                return True
+
+        return False
+
+    def _run_converter(self, command: List[str]) -> bool:
+        """Run a command-line converter; True if it exited successfully."""
+        if not _has_command(command[0]):
+            return False
+        try:
+            result = subprocess.run(command, capture_output=True, text=True)
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def _convert_with_resvg(self, svg_path: str, output_path: str, width: int, height: int) -> bool:
+        """Convert with the resvg command-line tool."""
+        return self._run_converter([
+            "resvg",
+            "-w", str(width),
+            "-h", str(height),
+            svg_path,
+            output_path
+        ])
+
+    def _convert_with_rsvg(self, svg_path: str, output_path: str, width: int, height: int) -> bool:
+        """Convert with rsvg-convert (librsvg)."""
+        return self._run_converter([
+            "rsvg-convert",
+            "-w", str(width),
+            "-h", str(height),
+            "-o", output_path,
+            svg_path
+        ])
+
+    def _convert_with_cairosvg(self, svg_path: str, output_path: str, width: int, height: int) -> bool:
+        """Convert in-process with cairosvg."""
+        if not _has_module("cairosvg"):
+            return False
         try:
             import cairosvg
             cairosvg.svg2png(
@@ -287,52 +642,25 @@ class TextOverlayProcessor:
             )
             return True
         except ImportError:
-            pass
+            return False
         except Exception:
-            pass
-
-        # Method 2: rsvg-convert
-        try:
-            result = subprocess.run(
-                [
-                    "rsvg-convert",
-                    "-w", str(width),
-                    "-h", str(height),
-                    "-o", output_path,
-                    svg_path
-                ],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return True
-        except FileNotFoundError:
-            pass
-        except Exception:
-            pass
-
-        # Method 3: inkscape
-        try:
-            result = subprocess.run(
-                [
-                    "inkscape",
-                    svg_path,
-                    "--export-type=png",
-                    f"--export-filename={output_path}",
-                    f"--export-width={width}",
-                    f"--export-height={height}"
-                ],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return True
-        except FileNotFoundError:
-            pass
-        except Exception:
-            pass
-
-        # Method 4: Pillow with svglib (fallback)
+            return False
+
+    def _convert_with_inkscape(self, svg_path: str, output_path: str, width: int, height: int) -> bool:
+        """Convert with the inkscape command-line tool."""
+        return self._run_converter([
+            "inkscape",
+            svg_path,
+            "--export-type=png",
+            f"--export-filename={output_path}",
+            f"--export-width={width}",
+            f"--export-height={height}"
+        ])
+
+    def _convert_with_svglib(self, svg_path: str, output_path: str, width: int, height: int) -> bool:
+        """Convert with svglib + reportlab (fallback)."""
+        if not (_has_module("svglib") and _has_module("reportlab")):
+            return False
         try:
             from svglib.svglib import svg2rlg
             from reportlab.graphics import renderPM
@@ -341,11 +669,9 @@ class TextOverlayProcessor:
             renderPM.drawToFile(drawing, output_path, fmt="PNG")
             return True
         except ImportError:
-            pass
+            return False
         except Exception:
-            pass
-
-        return False
+            return False
 
 
 def create_thumbnail_with_text(
@@ -374,7 +700,7 @@ def create_thumbnail_with_text(
     Returns:
         Dict with 'success', 'output_path', 'error'
     """
-    # Get image dimensions
+    # Get image dimensions (passed on to process() so it is read only once)
     with Image.open(background_image) as img:
         width, height = img.size
 
@@ -420,6 +746,8 @@ def create_thumbnail_with_text(
     config = TextOverlayConfig(
         background_image_path=background_image,
         output_path=output_path,
+        width=width,
+        height=height,
         text_elements=text_elements,
     )
 
@@ -448,7 +776,7 @@ def add_text_to_existing_image(
     """
     from .prompt_converter import TextOverlayConfig as PromptTextConfig
 
-    # Get image dimensions
+    # Get image dimensions (passed on to process() so it is read only once)
     with Image.open(image_path) as img:
         width, height = img.size
 
@@ -509,6 +837,8 @@ def add_text_to_existing_image(
     config = TextOverlayConfig(
         background_image_path=image_path,
         output_path=final_output,
+        width=width,
+        height=height,
         text_elements=text_elements,
     )
 
@@ -558,7 +888,6 @@ def add_watermark_to_image(
     if not watermark_config.watermark_enabled:
         # Just copy the file if watermark is disabled
         if output_path and output_path != image_path:
-            import shutil
             shutil.copy2(image_path, output_path)
         return {
             "success": True,
@@ -566,7 +895,7 @@ def add_watermark_to_image(
             "error": None
         }
 
-    # Get image dimensions
+    # Get image dimensions (passed on to process() so it is read only once)
     with Image.open(image_path) as img:
         width, height = img.size
 
@@ -605,6 +934,8 @@ def add_watermark_to_image(
     config = TextOverlayConfig(
         background_image_path=image_path,
         output_path=final_output,
+        width=width,
+        height=height,
         text_elements=text_elements,
     )
 
@@ -4,6 +4,7 @@ Common utility functions
 Provides common functionality for filename normalization, date handling, text cleanup, etc.
 """
 
+import functools
 import re
 import unicodedata
 from datetime import datetime
@@ -11,6 +12,25 @@ from pathlib import Path
 from typing import Optional
 
 
+# Filename normalization
+_FILENAME_INVALID_RE = re.compile(r'[^\w가-힣\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HYPHENS_RE = re.compile(r'-+')
+
+# Text cleanup
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_IMAGE_PLACEHOLDER_RE = re.compile(r'\[이미지\s*\d+\s*삽입[^\]]*\]')
+
+# Relative time ("3시간 전") and minutes per unit
+_TIME_AGO_RE = re.compile(r'(\d+)\s*(분|시간|일)\s*전')
+_TIME_AGO_MINUTES = {'분': 1, '시간': 60, '일': 60 * 24}
+
+# Image extensions recognized in URLs
+_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'webp', 'svg'})
+
+
+@functools.lru_cache(maxsize=512)
 def normalize_filename(text: str, max_length: int = 50) -> str:
     """
     Normalize text for use as a filename.
@@ -26,18 +46,22 @@ def normalize_filename(text: str, max_length: int = 50) -> str:
         >>> normalize_filename("2026년 육아휴직 변경 사항!")
         '2026년-육아휴직-변경-사항'
     """
+    # Already a plain ASCII word (letters, digits, underscores): nothing to change
+    if len(text) <= max_length and text.isascii() and text.replace('_', '').isalnum():
+        return text
+
     # Unicode normalization (NFC)
     text = unicodedata.normalize("NFC", text)
 
     # Remove special characters not allowed in filenames
     # Allowed: Korean, English, numbers, hyphens, underscores
-    text = re.sub(r'[^\w가-힣\s-]', '', text)
+    text = _FILENAME_INVALID_RE.sub('', text)
 
     # Convert consecutive spaces to hyphens
-    text = re.sub(r'\s+', '-', text.strip())
+    text = _WHITESPACE_RE.sub('-', text.strip())
 
     # Remove consecutive hyphens
-    text = re.sub(r'-+', '-', text)
+    text = _HYPHENS_RE.sub('-', text)
 
     # Remove leading/trailing hyphens
     text = text.strip('-')
@@ -100,7 +124,7 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Normalize multiple line breaks to two
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _EXTRA_NEWLINES_RE.sub('\n\n', text)
 
     # Remove trailing whitespace from lines
     lines = [line.rstrip() for line in text.split('\n')]
@@ -120,15 +144,13 @@ def extract_extension_from_url(url: str) -> str:
         Extension (default: 'jpg')
     """
     # Remove query parameters from URL
-    clean_url = url.split('?')[0]
+    clean_url = url.split('?', 1)[0]
 
-    # Extract extension
-    extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']
-    lower_url = clean_url.lower()
-
-    for ext in extensions:
-        if lower_url.endswith(ext):
-            return ext[1:]  # Remove dot
+    # Extract extension (only the part after the last dot is lowercased)
+    _, dot, ext = clean_url.rpartition('.')
+    ext = ext.lower()
+    if dot and ext in _IMAGE_EXTENSIONS:
+        return ext
 
     return 'jpg'  # Default
 
@@ -173,13 +195,13 @@ def count_chars_excluding_html(html_content: str) -> int:
         Character count (including spaces)
     """
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html_content)
+    text = _HTML_TAG_RE.sub('', html_content)
 
     # Remove image placeholders
-    text = re.sub(r'\[이미지\s*\d+\s*삽입[^\]]*\]', '', text)
+    text = _IMAGE_PLACEHOLDER_RE.sub('', text)
 
     # Normalize consecutive spaces to single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
 
     return len(text.strip())
 
@@ -212,16 +234,9 @@ def parse_time_ago(time_str: str) -> Optional[int]:
     Returns:
         Time in minutes (None if parsing fails)
     """
-    patterns = [
-        (r'(\d+)\s*분\s*전', 1),
-        (r'(\d+)\s*시간\s*전', 60),
-        (r'(\d+)\s*일\s*전', 60 * 24),
-    ]
-
-    for pattern, multiplier in patterns:
-        match = re.search(pattern, time_str)
-        if match:
-            return int(match.group(1)) * multiplier
+    match = _TIME_AGO_RE.search(time_str)
+    if match:
+        return int(match.group(1)) * _TIME_AGO_MINUTES[match.group(2)]
 
     return None
 
@@ -5,13 +5,21 @@ Validates character count of pure text excluding HTML tags,
 and suggests adjustments when over/under the limit.
 """
 
+import functools
 import re
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from .config import get_config, get_config_value
+from .shared_types import DATACLASS_SLOTS
 
 
-@dataclass
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_IMAGE_PLACEHOLDER_RE = re.compile(r'\[이미지\s*\d+\s*삽입[^\]]*\]')
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL)
+_SECTION_HEADER_RE = re.compile(r'<h[23][^>]*>(.*?)</h[23]>', re.DOTALL)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Character count validation result"""
     char_count: int          # Actual character count
@@ -34,8 +42,12 @@ def strip_html_tags(html_content: str) -> str:
     Returns:
         Text with tags removed
     """
+    # Plain text (e.g. most section titles): nothing to strip
+    if '<' not in html_content:
+        return html_content
+
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html_content)
+    text = _HTML_TAG_RE.sub('', html_content)
     return text
 
 
@@ -54,10 +66,10 @@ def remove_non_content(text: str) -> str:
         Cleaned text
     """
     # Remove image placeholders
-    text = re.sub(r'\[이미지\s*\d+\s*삽입[^\]]*\]', '', text)
+    text = _IMAGE_PLACEHOLDER_RE.sub('', text)
 
     # Remove CSS style blocks (if any remain)
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL)
+    text = _STYLE_BLOCK_RE.sub('', text)
 
     return text
 
@@ -72,11 +84,12 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Normalized text
     """
-    # Convert consecutive spaces to single space
-    text = re.sub(r'[ \t]+', ' ', text)
+    # Convert consecutive spaces/tabs to single space
+    # (split/join: dropped edge runs only matter before strip())
+    text = ' '.join(filter(None, text.replace('\t', ' ').split(' ')))
 
     # Treat line breaks as single space
-    text = re.sub(r'\n+', ' ', text)
+    text = ' '.join(filter(None, text.split('\n')))
 
     return text.strip()
 
@@ -102,11 +115,18 @@ def count_content_chars(html_content: str, include_spaces: bool = True) -> int:
     text = normalize_whitespace(text)
 
     if not include_spaces:
-        text = re.sub(r'\s+', '', text)
+        # str.split() splits on the same Unicode whitespace as \s
+        text = ''.join(text.split())
 
     return len(text)
 
 
+@functools.lru_cache(maxsize=32)
+def _count_document_chars(html_content: str) -> int:
+    """count_content_chars() for whole documents, memoized for repeated saves/reports."""
+    return count_content_chars(html_content)
+
+
 def validate_char_count(html_content: str, config: Optional[dict] = None) -> ValidationResult:
     """
     Validate character count.
@@ -121,11 +141,15 @@ def validate_char_count(html_content: str, config: Optional[dict] = None) -> Val
     if config is None:
         config = get_config()
 
-    target = get_config_value(config, "writing", "char_count", default=1850)
-    min_chars = get_config_value(config, "writing", "min_chars", default=1800)
-    max_chars = get_config_value(config, "writing", "max_chars", default=1900)
+    # One nested lookup for the three writing limits
+    writing = get_config_value(config, "writing", default={})
+    if not isinstance(writing, dict):
+        writing = {}
+    target = writing.get("char_count", 1850)
+    min_chars = writing.get("min_chars", 1800)
+    max_chars = writing.get("max_chars", 1900)
 
-    char_count = count_content_chars(html_content)
+    char_count = _count_document_chars(html_content)
     difference = char_count - target
 
     if char_count < min_chars:
@@ -166,8 +190,7 @@ def get_section_breakdown(html_content: str) -> List[Tuple[str, int]]:
     sections = []
 
     # Split sections by h2, h3 tags
-    pattern = r'<h[23][^>]*>(.*?)</h[23]>'
-    matches = list(re.finditer(pattern, html_content, re.DOTALL))
+    matches = list(_SECTION_HEADER_RE.finditer(html_content))
 
     if not matches:
         # If no section divisions, treat entire content as one section
@@ -220,13 +243,18 @@ def suggest_adjustment(result: ValidationResult) -> str:
     return "\n".join(suggestions)
 
 
-def print_validation_report(html_content: str, config: Optional[dict] = None) -> ValidationResult:
+def print_validation_report(
+    html_content: str,
+    config: Optional[dict] = None,
+    with_sections: bool = True
+) -> ValidationResult:
     """
     Print character count validation report.
 
     Args:
         html_content: HTML content
         config: Configuration dictionary
+        with_sections: Include the per-section breakdown (default: True)
 
     Returns:
         ValidationResult object
@@ -248,11 +276,12 @@ def print_validation_report(html_content: str, config: Optional[dict] = None) ->
         print(suggest_adjustment(result))
 
     # Section analysis
-    print("-" * 50)
-    print("📑 Character count by section:")
-    sections = get_section_breakdown(html_content)
-    for section_name, char_count in sections:
-        print(f"  - {section_name}: {char_count} chars")
+    if with_sections:
+        print("-" * 50)
+        print("📑 Character count by section:")
+        sections = get_section_breakdown(html_content)
+        for section_name, char_count in sections:
+            print(f"  - {section_name}: {char_count} chars")
 
     print("=" * 50)
 
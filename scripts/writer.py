@@ -8,7 +8,7 @@ import re
 from datetime import datetime
 from pathlib import Path
 from string import Template
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from .config import get_config, get_config_value
 from .utils import get_today_date, clean_text
@@ -16,6 +16,41 @@ from .validator import validate_char_count, ValidationResult
 from .setup import update_metadata
 
 
+# Static document head shared by every generated post
+_HTML_HEAD = '\n'.join([
+    '<!DOCTYPE html>',
+    '<html>',
+    '<head>',
+    '  <meta charset="UTF-8">',
+    '  <style>',
+    '    body { font-family: "Noto Sans KR", sans-serif; line-height: 1.8; max-width: 700px; margin: 0 auto; padding: 20px; }',
+    '    h1 { font-size: 28px; font-weight: bold; margin-bottom: 20px; }',
+    '    h2 { font-size: 24px; font-weight: bold; margin: 32px 0 16px; }',
+    '    h3 { font-size: 18px; font-weight: bold; margin: 24px 0 12px; }',
+    '    p { font-size: 16px; margin: 12px 0; }',
+    '    blockquote { border-left: 4px solid #4A90D9; padding-left: 16px; color: #555; margin: 16px 0; }',
+    '    .highlight-quote { background: #f0f7ff; padding: 16px; border-radius: 8px; border-left: none; }',
+    '    hr { border: none; border-top: 1px solid #ddd; margin: 24px 0; }',
+    '    .thick-hr { border-top: 3px solid #333; }',
+    '    table { border-collapse: collapse; width: 100%; margin: 16px 0; }',
+    '    th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }',
+    '    th { background: #f5f5f5; font-weight: bold; }',
+    '    .cta { font-size: 24px; font-weight: bold; text-align: center; margin: 32px 0; color: #4A90D9; }',
+    '    .small { font-size: 12px; color: #888; }',
+    '    .image-placeholder { color: #999; text-align: center; padding: 40px; background: #f9f9f9; margin: 16px 0; }',
+    '    .tags { color: #4A90D9; margin-top: 32px; }',
+    '  </style>',
+    '</head>',
+    '<body>',
+])
+
+# Closing tags after the tag line
+_HTML_TAIL = '\n</body>\n</html>'
+
+# Template file contents per path, invalidated by st_mtime_ns
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, str]] = {}
+
+
 def load_template(template_name: str, templates_dir: Optional[Path] = None) -> str:
     """
     Load template file.
@@ -34,11 +69,21 @@ def load_template(template_name: str, templates_dir: Optional[Path] = None) -> s
 
     template_path = templates_dir / template_name
 
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
+    try:
+        mtime_ns = template_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _TEMPLATE_CACHE.pop(template_path, None)
+        raise FileNotFoundError(f"Template not found: {template_path}") from None
+
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
 
     with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
+        content = f.read()
+
+    _TEMPLATE_CACHE[template_path] = (mtime_ns, content)
+    return content
 
 
 def render_template(template_content: str, context: Dict[str, Any]) -> str:
@@ -88,30 +133,7 @@ def generate_html_content(
 
     # HTML template start
     html_parts = [
-        '<!DOCTYPE html>',
-        '<html>',
-        '<head>',
-        '  <meta charset="UTF-8">',
-        '  <style>',
-        '    body { font-family: "Noto Sans KR", sans-serif; line-height: 1.8; max-width: 700px; margin: 0 auto; padding: 20px; }',
-        '    h1 { font-size: 28px; font-weight: bold; margin-bottom: 20px; }',
-        '    h2 { font-size: 24px; font-weight: bold; margin: 32px 0 16px; }',
-        '    h3 { font-size: 18px; font-weight: bold; margin: 24px 0 12px; }',
-        '    p { font-size: 16px; margin: 12px 0; }',
-        '    blockquote { border-left: 4px solid #4A90D9; padding-left: 16px; color: #555; margin: 16px 0; }',
-        '    .highlight-quote { background: #f0f7ff; padding: 16px; border-radius: 8px; border-left: none; }',
-        '    hr { border: none; border-top: 1px solid #ddd; margin: 24px 0; }',
-        '    .thick-hr { border-top: 3px solid #333; }',
-        '    table { border-collapse: collapse; width: 100%; margin: 16px 0; }',
-        '    th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }',
-        '    th { background: #f5f5f5; font-weight: bold; }',
-        '    .cta { font-size: 24px; font-weight: bold; text-align: center; margin: 32px 0; color: #4A90D9; }',
-        '    .small { font-size: 12px; color: #888; }',
-        '    .image-placeholder { color: #999; text-align: center; padding: 40px; background: #f9f9f9; margin: 16px 0; }',
-        '    .tags { color: #4A90D9; margin-top: 32px; }',
-        '  </style>',
-        '</head>',
-        '<body>',
+        _HTML_HEAD,
         '',
         f'<h1>{title}</h1>',
         '',
@@ -153,13 +175,9 @@ def generate_html_content(
         html_parts.append('\n<hr>\n')
 
     # Add tags
-    tags_str = ' '.join(f'#{tag}' for tag in tags)
-    html_parts.extend([
-        f'\n<p class="tags">{tags_str}</p>',
-        '',
-        '</body>',
-        '</html>',
-    ])
+    tags_str = '#' + ' #'.join(tags) if tags else ''
+    html_parts.append(f'\n<p class="tags">{tags_str}</p>')
+    html_parts.append(_HTML_TAIL)
 
     return '\n'.join(html_parts)
 